@@ -1,10 +1,37 @@
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    # The bot creates its event loop when gh_linker.bot is imported, so the policy
+    # has to be in place before that import for the loop to be a uvloop one.
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 from gh_linker.bot import bot
 
 from dotenv import load_dotenv
+from logging.handlers import QueueHandler, QueueListener
+import atexit
 import os
 import logging
+import queue
+
+# Log records are handed to a background thread so that writing them to stderr
+# never blocks the event loop.
+log_queue = queue.SimpleQueue()
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+log_listener = QueueListener(log_queue, stream_handler)
 
-logging.basicConfig(level=logging.INFO)
+# The QueueHandler gets no formatter of its own, the listener's handler formats records.
+root_logger = logging.getLogger()
+root_logger.addHandler(QueueHandler(log_queue))
+root_logger.setLevel(logging.INFO)
+log_listener.start()
+# Stopping the listener writes out anything still queued.
+atexit.register(log_listener.stop)
 
 load_dotenv()
 
@@ -1,5 +1,7 @@
 from contextlib import suppress
-from aiohttp import ClientSession
+from typing import Optional
+
+from aiohttp import ClientSession, TCPConnector
 from discord.ext import commands
 from discord.ext.commands import Cog
 from discord import Forbidden, Thread
@@ -12,7 +14,34 @@ class Bot(commands.Bot):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.http_session = ClientSession()
+        self.http_session: Optional[ClientSession] = None
+        # The help extension's command, resolved once in `start`. This goes stale if the
+        # help extension is reloaded or unloaded at runtime, which this bot never does.
+        self.resolved_help_command: Optional[commands.Command] = None
+
+    async def start(self, *args, **kwargs) -> None:
+        """
+        Create the shared HTTP session inside the running loop, then start the bot.
+        All outbound HTTP in cogs should go through `bot.http_session`.
+        """
+        self.http_session = ClientSession(
+            connector=TCPConnector(
+                limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=75
+            )
+        )
+        self._resolve_help_command()
+        await super().start(*args, **kwargs)
+
+    def _resolve_help_command(self) -> None:
+        """Look up the help extension's command, extensions are loaded before starting."""
+        if "bot.exts.core.help" in self.extensions:
+            self.resolved_help_command = self.get_command("help")
+
+    async def close(self) -> None:
+        """Close the shared HTTP session before closing the bot."""
+        if self.http_session is not None:
+            await self.http_session.close()
+        await super().close()
 
     @Cog.listener()
     async def on_thread_join(self, thread: Thread) -> None:
@@ -25,6 +54,14 @@ class Bot(commands.Bot):
             # Already in this thread, return early
             return
 
+        # permissions_for needs the parent channel, if it isn't cached just try to join
+        if (
+            thread.parent is not None
+            and not thread.permissions_for(thread.guild.me).send_messages_in_threads
+        ):
+            # Joining would be pointless, as we couldn't answer commands
+            return
+
         with suppress(Forbidden):
             await thread.join()
 
@@ -255,9 +255,11 @@ class CodeSnippets(Cog):
                     error_message = error.message  # noqa: B306
                     log.log(
                         logging.DEBUG if error.status == 404 else logging.ERROR,
-                        f"Failed to fetch code snippet from {match[0]!r}:"
-                        f" {error.status} {error_message} for GET"
-                        f" {error.request_info.real_url.human_repr()}",
+                        "Failed to fetch code snippet from %r: %s %s for GET %s",
+                        match[0],
+                        error.status,
+                        error_message,
+                        error.request_info.real_url,
                     )
 
         # Sorts the list of snippets by their match index and joins them into a single message
@@ -122,7 +122,7 @@ class GithubInfo(commands.Cog):
 
         if r.status == 403:
             if r.headers.get("X-RateLimit-Remaining") == "0":
-                log.info(f"Ratelimit reached while fetching {url}")
+                log.info("Ratelimit reached while fetching %s", url)
                 return FetchError(
                     403, "Ratelimit reached, please retry in a few minutes."
                 )
@@ -242,7 +242,7 @@ class GithubInfo(commands.Cog):
 
     async def fetch_data(self, url: str) -> tuple[dict[str, t.Any], ClientResponse]:
         """Retrieve data as a dictionary and the response in a tuple."""
-        log.debug(f"Querying GH issues API: {url}")
+        log.debug("Querying GH issues API: %s", url)
         async with self.bot.http_session.get(url, headers=REQUEST_HEADERS) as r:
             return await r.json(), r
 
@@ -29,7 +29,6 @@
 import asyncio
 from collections import abc
 import contextlib
-from functools import partial
 import logging
 from typing import Sequence
 import typing
@@ -39,6 +38,14 @@ from gh_linker.bot import bot
 
 log = logging.getLogger(__name__)
 
+# Seconds to pool disallowed reactions on a message before removing them.
+REACTION_REMOVAL_DELAY = 0.25
+
+# Emojis of disallowed reactions waiting to be removed, keyed by (message id, user id).
+_pending_removals: dict[
+    tuple[int, int], set[typing.Union[discord.Emoji, discord.PartialEmoji, str]]
+] = {}
+
 
 class Channels:
     bot_commands = "497046178903490560"
@@ -64,9 +71,8 @@ class Emojis:
 
 async def invoke_help_command(ctx: Context) -> None:
     """Invoke the help command or default help command if help extensions is not loaded."""
-    if "bot.exts.core.help" in ctx.bot.extensions:
-        help_command = ctx.bot.get_command("help")
-        await ctx.invoke(help_command, ctx.command.qualified_name)
+    if ctx.bot.resolved_help_command is not None:
+        await ctx.invoke(ctx.bot.resolved_help_command, ctx.command.qualified_name)
         return
     await ctx.send_help(ctx.command)
 
@@ -74,6 +80,34 @@ async def invoke_help_command(ctx: Context) -> None:
 TASK_RETURN = typing.TypeVar("TASK_RETURN")
 
 
+class _TaskExcLogger:
+    """Task done-callback which logs the exception raised in the task, if any."""
+
+    __slots__ = ("_suppressed",)
+
+    def __init__(self, suppressed_exceptions: tuple[type[Exception]]):
+        self._suppressed = suppressed_exceptions
+
+    def __call__(self, task: asyncio.Task) -> None:
+        """Retrieve and log the exception raised in ``task`` if one exists."""
+        with contextlib.suppress(asyncio.CancelledError):
+            exception = task.exception()
+            # Log the exception if one exists.
+            if exception and (
+                not self._suppressed or not isinstance(exception, self._suppressed)
+            ):
+                log.error(
+                    "Error in task %s %s!",
+                    task.get_name(),
+                    id(task),
+                    exc_info=exception,
+                )
+
+
+# Shared by every task that doesn't suppress any exceptions.
+_DEFAULT_TASK_EXC_LOGGER = _TaskExcLogger(())
+
+
 def create_task(
     coro: abc.Coroutine[typing.Any, typing.Any, TASK_RETURN],
     *,
@@ -89,69 +123,58 @@ def create_task(
         coro: The function to call.
         suppressed_exceptions: Exceptions to be handled by the task.
         event_loop (:obj:`asyncio.AbstractEventLoop`): The loop to create the task from.
-        kwargs: Passed to :py:func:`asyncio.create_task`.
+        kwargs: Passed to :py:meth:`asyncio.loop.create_task`.
     Returns:
         asyncio.Task: The wrapped task.
     """
-    if event_loop is not None:
-        task = event_loop.create_task(coro, **kwargs)
-    else:
-        task = asyncio.create_task(coro, **kwargs)
+    if event_loop is None:
+        event_loop = asyncio.get_running_loop()
+    task = event_loop.create_task(coro, **kwargs)
     task.add_done_callback(
-        partial(_log_task_exception, suppressed_exceptions=suppressed_exceptions)
+        _TaskExcLogger(suppressed_exceptions)
+        if suppressed_exceptions
+        else _DEFAULT_TASK_EXC_LOGGER
     )
     return task
 
 
-def _log_task_exception(
-    task: asyncio.Task, *, suppressed_exceptions: tuple[type[Exception]]
+def _remove_disallowed_reaction(
+    reaction: discord.Reaction, user: discord.abc.User
 ) -> None:
-    """Retrieve and log the exception raised in ``task`` if one exists."""
-    with contextlib.suppress(asyncio.CancelledError):
-        exception = task.exception()
-        # Log the exception if one exists.
-        if exception and not isinstance(exception, suppressed_exceptions):
-            log = logging.getLogger(__name__)
-            log.error(
-                f"Error in task {task.get_name()} {id(task)}!", exc_info=exception
-            )
-
+    """Schedule removal of a reaction made by a user who isn't allowed to use it."""
+    log.debug(
+        "Removing reaction %s by %d on %d: disallowed user.",
+        reaction.emoji,
+        user.id,
+        reaction.message.id,
+    )
+    key = (reaction.message.id, user.id)
+    pending = _pending_removals.get(key)
+    if pending is not None:
+        # A removal is already scheduled for this user on this message.
+        pending.add(reaction.emoji)
+        return
 
-def reaction_check(
-    reaction: discord.Reaction,
-    user: discord.abc.User,
-    *,
-    message_id: int,
-    allowed_emoji: Sequence[str],
-    allowed_users: Sequence[int],
-) -> bool:
-    """
-    Check if a reaction's emoji and author are allowed and the message is `message_id`.
-    If the user is not allowed, remove the reaction. Ignore reactions made by the bot.
-    If `allow_mods` is True, allow users with moderator roles even if they're not in `allowed_users`.
-    """
-    right_reaction = (
-        user != bot.user
-        and reaction.message.id == message_id
-        and str(reaction.emoji) in allowed_emoji
+    _pending_removals[key] = {reaction.emoji}
+    create_task(
+        _remove_pending_reactions(reaction.message, user, key),
+        event_loop=bot.loop,
+        name=f"remove_reactions-{reaction.message.id}-{user.id}",
     )
-    if not right_reaction:
-        return False
 
-    if user.id in allowed_users:
-        log.debug(f"Allowed reaction {reaction} by {user} on {reaction.message.id}.")
-        return True
-    else:
-        log.debug(
-            f"Removing reaction {reaction} by {user} on {reaction.message.id}:"
-            " disallowed user."
-        )
-        create_task(
-            reaction.message.remove_reaction(reaction.emoji, user),
-            suppressed_exceptions=(discord.HTTPException,),
-            name=f"remove_reaction-{reaction}-{reaction.message.id}-{user}",
-        )
-        return False
+
+async def _remove_pending_reactions(
+    message: discord.Message, user: discord.abc.User, key: tuple[int, int]
+) -> None:
+    """Remove every reaction pooled under `key` once `REACTION_REMOVAL_DELAY` has passed."""
+    try:
+        await asyncio.sleep(REACTION_REMOVAL_DELAY)
+    finally:
+        # Always release the key, so cancelling this task doesn't block later removals.
+        emojis = _pending_removals.pop(key)
+    for emoji in emojis:
+        with contextlib.suppress(discord.HTTPException):
+            await message.remove_reaction(emoji, user)
 
 
 async def wait_for_deletion(
@@ -173,22 +196,56 @@ async def wait_for_deletion(
         raise ValueError("Message must be sent on a guild")
 
     if attach_emojis:
+        # Added one at a time to keep their order, the reaction rate limit would
+        # serialize concurrent requests anyway.
         for emoji in deletion_emojis:
             try:
                 await message.add_reaction(emoji)
             except discord.NotFound:
                 log.debug(
-                    f"Aborting wait_for_deletion: message {message.id} deleted"
-                    " prematurely."
+                    "Aborting wait_for_deletion: message %s deleted prematurely.",
+                    message.id,
                 )
                 return
 
-    check = partial(
-        reaction_check,
-        message_id=message.id,
-        allowed_emoji=deletion_emojis,
-        allowed_users=user_ids,
+    # Resolve everything the check needs once, as it runs for every reaction the bot sees.
+    bot_user_id = bot.user.id
+    message_id = message.id
+    # Custom emojis ("<:name:id>") are matched by id, unicode emojis by the string itself.
+    allowed_unicode_emoji = frozenset(
+        emoji for emoji in deletion_emojis if not emoji.startswith("<")
+    )
+    allowed_emoji_ids = frozenset(
+        int(emoji.rsplit(":", 1)[1][:-1])
+        for emoji in deletion_emojis
+        if emoji.startswith("<")
     )
+    allowed_users = frozenset(user_ids)
+
+    def check(reaction: discord.Reaction, user: discord.abc.User) -> bool:
+        """
+        Check if a reaction's emoji and author are allowed and the message is `message`.
+        If the user is not allowed, remove the reaction. Ignore reactions made by the bot.
+        """
+        if reaction.message.id != message_id or user.id == bot_user_id:
+            return False
+        emoji = reaction.emoji
+        if isinstance(emoji, str):
+            if emoji not in allowed_unicode_emoji:
+                return False
+        elif emoji.id not in allowed_emoji_ids:
+            return False
+
+        if user.id in allowed_users:
+            log.debug(
+                "Allowed reaction %s by %d on %d.",
+                reaction.emoji,
+                user.id,
+                reaction.message.id,
+            )
+            return True
+        _remove_disallowed_reaction(reaction, user)
+        return False
 
     try:
         try:
@@ -198,4 +255,4 @@ async def wait_for_deletion(
         else:
             await message.delete()
     except discord.NotFound:
-        log.debug(f"wait_for_deletion: message {message.id} deleted prematurely.")
+        log.debug("wait_for_deletion: message %s deleted prematurely.", message.id)